@@ -5,8 +5,8 @@ Copyright (c) 2025 pifuyuini
 
 Author: pifuyuini
 Email: You can contact me via Github
-Version: 1.5.0
-Date: 2025-05-05
+Version: 1.6.0
+Date: 2026-10-15
 
 Description:
     This module provides a set of utility functions and styling presets for creating high-quality, customizable
@@ -19,12 +19,14 @@ Description:
     Key Features:
     - `ysy_settings`: Configures global Matplotlib settings with options for DPI, color, font, and marker styles.
     - `science_settings`: Minimalist scientific plotting style optimized for paper-ready figures.
-    - `firefly`: Provides a predefined set of color codes or palettes based on a personalized theme.
+    - `YSY_DEFAULT`, `YSY_JUPYTER`, `SCIENCE_DEFAULT`: Precomputed results of the most common settings calls.
+    - `apply_settings`: Applies a settings dictionary globally or as a temporary `rc_context`.
+    - `PALETTE` / `firefly`: Provides a predefined set of color codes or palettes based on a personalized theme.
     - `firefly_color_theme`: Generates a Matplotlib colormap and gradient based on the firefly palette.
     - `plot`: High-level wrapper for quickly drawing single or multiple curves or scatter plots with legends.
     - `temp_style`: A context manager for temporarily applying custom Matplotlib styles by combining preset themes and user-defined style strings.
     - Auto support for Jupyter Notebook display and marker cycling.
-    - Support for additional Matplotlib style registration via temporary style files.
+    - Support for additional Matplotlib styles written in `.mplstyle` syntax, parsed once and applied without temporary files.
 
 License:
     This file is licensed under the MIT License. You may use, modify, and distribute it under the terms of the license.
@@ -61,25 +63,210 @@ Changelog:
 
     v1.5.0:
         Optimize code structure and user experience, add new themes, and add a new theme directory.
+
+    v1.6.0:
+        - Changed `temp_style`: on exit it restores the rcParams active before the `with` block (previously reset to
+          `'default'`), so earlier `ysy_settings` calls survive. Styles are parsed once and no temporary files are written;
+          bad lines and non-style keys (e.g. `backend`) are skipped with a warning.
+        - Added `plot(..., ax=None, show=True)` for drawing into an existing Axes; pyplot is imported only inside `plot`.
+        - `plot` now raises `ValueError` when `legend_name` and a tuple/list `y` differ in length (previously `IndexError`
+          or silently dropped series). Requires Python 3.10+.
+        - Added `apply_settings`, `PALETTE`, the firefly constants (`FGRAYBLUE`, `FGRAYGREEN`, `FRED`, `FBLUEGREEN`,
+          `FBLACK`, `FSILVER`) and the presets `YSY_DEFAULT`, `YSY_JUPYTER`, `SCIENCE_DEFAULT`.
+        - Added `read_only=` to `ysy_settings` and `science_settings`.
+        - `font.serif` in `ysy_settings` is now a tuple; the marker cycle uses the key `'linestyle'` instead of `'ls'`.
+        - `firefly_color_theme` caches its colormap and cycle and returns copies.
 """
 
-__version__ = "1.5.0"
+__version__ = "1.6.0"
 
 
 
 # Import necessary package
-import matplotlib.pyplot as plt
+import numpy as np
+import matplotlib as mpl  # pyplot 只在 `plot` 中按需导入，避免 import 本模块时就初始化后端
 from cycler import cycler
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, to_rgb
 ## v1.3新增
-import matplotlib.style as mplstyle
-import tempfile, os, contextlib
+import contextlib, warnings
+import copy
+import functools
+from types import SimpleNamespace, MappingProxyType
+
+
+# Palette
+
+## firefly colors, shared by `firefly` and the settings presets
+FGRAYBLUE = '#475d7b'
+FGRAYGREEN = '#97c6c0'
+FRED = '#e26e1b'
+FBLUEGREEN = '#4df8e8'
+FBLACK = '#3e324a'
+FSILVER = '#e6e4e0'
+
+_FIREFLY_FULL = (FGRAYBLUE, FGRAYGREEN, FRED, FBLUEGREEN, FBLACK, FSILVER)
+_FIREFLY_CYCLE = _FIREFLY_FULL[:4]
+_FIREFLY_MAP = {
+    None: _FIREFLY_FULL,
+    'cycle': _FIREFLY_CYCLE,
+    'fgrayblue': FGRAYBLUE, 
+    'fgraygreen': FGRAYGREEN, 
+    'fred': FRED, 
+    'fbluegreen': FBLUEGREEN, 
+    'fblack': FBLACK, 
+    'fsilver': FSILVER, 
+}
+
+## Preferred access to the palette: attribute lookup, e.g. `PALETTE.fred`, `PALETTE.cycle`
+PALETTE = SimpleNamespace(
+    full=_FIREFLY_FULL,
+    cycle=_FIREFLY_CYCLE,
+    fgrayblue=FGRAYBLUE,
+    fgraygreen=FGRAYGREEN,
+    fred=FRED,
+    fbluegreen=FBLUEGREEN,
+    fblack=FBLACK,
+    fsilver=FSILVER,
+)
+
+## Shared templates: Cycler objects are mutable (`change_key`) and `rcParams.update` installs the object itself,
+## so the settings functions hand out copies made by `_with_fresh_cycler`. The keys are already canonical
+## ('linestyle', not 'ls'), so rcParams validation has nothing to rename in place.
+_FIREFLY_COLOR_CYCLER = cycler('color', list(_FIREFLY_CYCLE))
+_MARKER_CYCLER = (cycler('marker', ['o', 's', '^', 'v', '<', '>', 'd']) + 
+                  cycler('color', ['#0C5DA5', '#00B945', '#FF9500', '#FF2C00', '#845B97', '#474747', '#9e9e9e']) + 
+                  cycler('linestyle', [' ', ' ', ' ', ' ', ' ', ' ', ' ']))
 
 
 # Settings
 
+## Static configuration blocks, built once at import and merged by the settings functions below
+_YSY_BASE_CONFIG = {
+    # Default 
+    # figure
+    'figure.figsize':(12.5, 9), 
+    # label
+    'axes.labelsize':27,
+    'axes.titlesize': 30,
+    # x
+    'xtick.major.size': 9,
+    'xtick.major.width': 1.5,
+    'xtick.minor.size': 4.5,
+    'xtick.minor.width': 1.5,
+    # y
+    'ytick.major.size': 9,
+    'ytick.major.width': 1.5,
+    'ytick.minor.size': 4.5,
+    'ytick.minor.width': 1.5,
+    # xy label
+    'xtick.labelsize': 25,
+    'ytick.labelsize': 25,
+    # grid
+    'axes.grid' : True,
+    'axes.axisbelow' : True,
+    'grid.linestyle': '--',
+    'grid.color': 'k',
+    'grid.alpha': 0.5,
+    'grid.linewidth': 0.5,
+    # legend
+    'legend.frameon': True,
+    'legend.framealpha': 1.0,
+    'legend.fancybox': True,
+    'legend.numpoints': 1,
+    'legend.shadow': True,
+    'legend.fontsize': 25,
+    'legend.title_fontsize': 25,
+    # font (font.family comes from _YSY_FONT or _YSY_PLAIN_FONT)
+    'axes.formatter.use_mathtext': True,
+    'mathtext.fontset': 'cm',
+    'text.usetex': False,
+    # line
+    'lines.linewidth': 3.,
+}
+# color
+_YSY_COLOR = {'axes.prop_cycle': _FIREFLY_COLOR_CYCLER}
+# font
+_YSY_FONT = {
+    # 元组不可变：各次调用的结果共享这一个值
+    'font.serif': ('cmr10', 'Computer Modern Serif', 'DejaVu Serif'),
+    'font.family': 'serif'
+}
+_YSY_PLAIN_FONT = {'font.family': 'Times New Roman'}
+# marker
+_YSY_MARKER = {
+    'axes.prop_cycle': _MARKER_CYCLER,
+    'lines.markersize': 3,
+}
+# Jupyter Notebook
+_YSY_JUPYTER = {
+    'figure.figsize': (8, 6),
+    'xtick.major.size': 6,
+    'xtick.major.width': 1,
+    'xtick.minor.size': 3,
+    'xtick.minor.width': 1,
+    'ytick.major.size': 6,
+    'ytick.major.width': 1,
+    'ytick.minor.size': 3,
+    'ytick.minor.width': 1,
+    'xtick.labelsize': 16,
+    'ytick.labelsize': 16,
+    'legend.fontsize': 16,
+    'legend.title_fontsize': 16,
+    'axes.titlesize': 16,
+    'axes.labelsize': 16,
+    'axes.linewidth': 1,
+    'grid.linewidth': 1,
+    'lines.linewidth': 2.,
+    'font.family': 'sans-serif',
+    'mathtext.fontset': 'dejavusans',
+    'text.usetex': False,
+}
+
+_SCIENCE_BASE_CONFIG = {
+    'axes.prop_cycle': cycler('color', ['#0C5DA5', '#00B945', '#FF9500', '#FF2C00', '#845B97', '#474747', '#9e9e9e']),
+    'figure.figsize': (3.5, 2.625),
+    'xtick.direction': 'in',
+    'xtick.major.size': 3,
+    'xtick.major.width': 0.5,
+    'xtick.minor.size': 1.5,
+    'xtick.minor.width': 0.5,
+    'xtick.minor.visible': True,
+    'xtick.top': True,
+    'ytick.direction': 'in',
+    'ytick.major.size': 3,
+    'ytick.major.width': 0.5,
+    'ytick.minor.size': 1.5,
+    'ytick.minor.width': 0.5,
+    'ytick.minor.visible': True,
+    'ytick.right': True,
+    'axes.linewidth': 0.5,
+    'grid.linewidth': 0.5,
+    'lines.linewidth': 1.0,
+    'legend.frameon': False,
+    'savefig.bbox': 'tight',
+    'savefig.pad_inches': 0.05,
+    'font.family': 'serif',
+    'mathtext.fontset': 'dejavuserif',
+}
+# legend frame
+_SCIENCE_LEGEND_FRAME = {
+    'legend.frameon': True,
+    'legend.framealpha': 1.0,
+}
+
+## Precomputed results for the most common argument patterns, filled in after the settings functions
+_YSY_PRESETS = {}
+_SCIENCE_PRESETS = {}
+
+def _with_fresh_cycler(config):
+    # 结果交给调用方前复制 cycler，调用方修改它不会影响模板和缓存
+    prop_cycle = config.get('axes.prop_cycle')
+    if prop_cycle is not None:
+        config['axes.prop_cycle'] = copy.deepcopy(prop_cycle)
+    return config
+
 ## Personal
-def ysy_settings(dpi=300, color=True, font=True, jupyter=False, marker=False):
+def ysy_settings(dpi=300, color=True, font=True, jupyter=False, marker=False, read_only=False):
     '''
     Configures Matplotlib plot settings to ensure consistent and high-quality visualizations.
 
@@ -93,9 +280,14 @@ def ysy_settings(dpi=300, color=True, font=True, jupyter=False, marker=False):
         font (bool, optional): Configures font family and style. Defaults to True.
         jupyter (bool, optional): Adapts settings for Jupyter Notebook display, with smaller sizes and simpler fonts. Defaults to False.
         marker (bool, optional): Adds a custom marker style cycle to the plots. Defaults to False.
+        read_only (bool, optional): Returns a read-only view instead of a fresh dict. For the common presets this
+            avoids copying; use it when the result is only passed to `rcParams.update()`. The view shares its
+            `axes.prop_cycle` cycler with later calls, so do not mutate it (or `rcParams['axes.prop_cycle']`
+            after applying it) in place. Defaults to False.
 
     Returns:
         dict: A dictionary containing Matplotlib configuration settings. This can be directly applied using `matplotlib.rcParams.update()`.
+            A `types.MappingProxyType` if `read_only` is True, e.g. `plt.rcParams.update(ysy_settings(read_only=True))`.
 
     Configuration Overview:
         - **Figure**: Default figure size and DPI.
@@ -115,105 +307,25 @@ def ysy_settings(dpi=300, color=True, font=True, jupyter=False, marker=False):
         >>> plt.show()
 
     '''
-    # Global
+    # 常用参数组合直接返回预先合并好的副本
+    preset = _YSY_PRESETS.get((dpi, color, font, jupyter, marker))
+    if preset is not None:
+        return MappingProxyType(preset) if read_only else _with_fresh_cycler(preset.copy())
+    # Global + Additional, merged in a single pass
     config = {
-        # Default 
-        # figure
-        'figure.figsize':(12.5, 9), 
-        # label
-        'axes.labelsize':27,
-        'axes.titlesize': 30,
-        # x
-        'xtick.major.size': 9,
-        'xtick.major.width': 1.5,
-        'xtick.minor.size': 4.5,
-        'xtick.minor.width': 1.5,
-        # y
-        'ytick.major.size': 9,
-        'ytick.major.width': 1.5,
-        'ytick.minor.size': 4.5,
-        'ytick.minor.width': 1.5,
-        # xy label
-        'xtick.labelsize': 25,
-        'ytick.labelsize': 25,
-        # grid
-        'axes.grid' : True,
-        'axes.axisbelow' : True,
-        'grid.linestyle': '--',
-        'grid.color': 'k',
-        'grid.alpha': 0.5,
-        'grid.linewidth': 0.5,
-        # legend
-        'legend.frameon': True,
-        'legend.framealpha': 1.0,
-        'legend.fancybox': True,
-        'legend.numpoints': 1,
-        'legend.shadow': True,
-        'legend.fontsize': 25,
-        'legend.title_fontsize': 25,
-        # font
-        'font.family': 'Times New Roman',
-        'axes.formatter.use_mathtext': True,
-        'mathtext.fontset': 'cm',
-        'text.usetex': False,
-        # line
-        'lines.linewidth': 3.,
-        }
-    # Additional
-    # dpi
-    if dpi != None:
-        add_dpi = {'figure.dpi': dpi}
-        config.update(add_dpi)
-    # color
-    if color:
-        add_color = {'axes.prop_cycle': cycler('color', firefly(requirement='cycle'))}
-        config.update(add_color)
-    # font
-    if font:
-        add_font = {
-            'font.serif': ['cmr10', 'Computer Modern Serif', 'DejaVu Serif'],
-            'font.family': 'serif'
-        }
-        config.update(add_font)
-    # marker
-    if marker:
-        add_marker = {
-            'axes.prop_cycle': (cycler('marker', ['o', 's', '^', 'v', '<', '>', 'd']) + 
-                    cycler('color', ['#0C5DA5', '#00B945', '#FF9500', '#FF2C00', '#845B97', '#474747', '#9e9e9e']) + 
-                    cycler('ls', [' ', ' ', ' ', ' ', ' ', ' ', ' '])),
-            'lines.markersize': 3,
-        }
-        config.update(add_marker)
-    # Jupyter Notebook
-    if jupyter:
-        add_jupyter = {
-            'figure.figsize': (8, 6),
-            'xtick.major.size': 6,
-            'xtick.major.width': 1,
-            'xtick.minor.size': 3,
-            'xtick.minor.width': 1,
-            'ytick.major.size': 6,
-            'ytick.major.width': 1,
-            'ytick.minor.size': 3,
-            'ytick.minor.width': 1,
-            'xtick.labelsize': 16,
-            'ytick.labelsize': 16,
-            'legend.fontsize': 16,
-            'legend.title_fontsize': 16,
-            'axes.titlesize': 16,
-            'axes.labelsize': 16,
-            'axes.linewidth': 1,
-            'grid.linewidth': 1,
-            'lines.linewidth': 2.,
-            'font.family': 'sans-serif',
-            'mathtext.fontset': 'dejavusans',
-            'text.usetex': False,
-        }
-        config.update(add_jupyter)
-    return config
+        **_YSY_BASE_CONFIG,
+        **({'figure.dpi': dpi} if dpi is not None else {}),
+        **(_YSY_COLOR if color else {}),
+        **(_YSY_FONT if font else _YSY_PLAIN_FONT),
+        **(_YSY_MARKER if marker else {}),
+        **(_YSY_JUPYTER if jupyter else {}),
+    }
+    if read_only:
+        return MappingProxyType(config)
+    return _with_fresh_cycler(config)
 
 ## Science
-def science_settings(dpi=None, frame_on=False):
+def science_settings(dpi=None, frame_on=False, read_only=False):
     '''
     Configures Matplotlib settings optimized for scientific plots.
 
@@ -224,9 +336,12 @@ def science_settings(dpi=None, frame_on=False):
     Args:
         dpi (int, optional): Dots per inch (DPI) for figure resolution. Defaults to 300.
         frame_on (bool, optional): Toggles the display of a legend frame. Defaults to False.
+        read_only (bool, optional): Returns a read-only view instead of a fresh dict. As in `ysy_settings`, its
+            `axes.prop_cycle` cycler is shared and must not be mutated in place. Defaults to False.
 
     Returns:
         dict: A dictionary of Matplotlib configuration settings. This can be applied using `matplotlib.rcParams.update()`.
+            A `types.MappingProxyType` if `read_only` is True.
 
     Configuration Details:
         - **Color Cycle**: A predefined set of colors for plots.
@@ -254,45 +369,57 @@ def science_settings(dpi=None, frame_on=False):
         - The `frame_on` parameter provides flexibility to include or exclude a legend frame.
 
     '''
+    preset = _SCIENCE_PRESETS.get((dpi, frame_on))
+    if preset is not None:
+        return MappingProxyType(preset) if read_only else _with_fresh_cycler(preset.copy())
+    # Global + Additional, merged in a single pass
     config = {
-    'axes.prop_cycle': cycler('color', ['#0C5DA5', '#00B945', '#FF9500', '#FF2C00', '#845B97', '#474747', '#9e9e9e']),
-    'figure.figsize': (3.5, 2.625),
-    'xtick.direction': 'in',
-    'xtick.major.size': 3,
-    'xtick.major.width': 0.5,
-    'xtick.minor.size': 1.5,
-    'xtick.minor.width': 0.5,
-    'xtick.minor.visible': True,
-    'xtick.top': True,
-    'ytick.direction': 'in',
-    'ytick.major.size': 3,
-    'ytick.major.width': 0.5,
-    'ytick.minor.size': 1.5,
-    'ytick.minor.width': 0.5,
-    'ytick.minor.visible': True,
-    'ytick.right': True,
-    'axes.linewidth': 0.5,
-    'grid.linewidth': 0.5,
-    'lines.linewidth': 1.0,
-    'legend.frameon': False,
-    'savefig.bbox': 'tight',
-    'savefig.pad_inches': 0.05,
-    'font.family': 'serif',
-    'mathtext.fontset': 'dejavuserif',
+        **_SCIENCE_BASE_CONFIG,
+        **({'figure.dpi': dpi} if dpi is not None else {}),
+        **(_SCIENCE_LEGEND_FRAME if frame_on else {}),
     }
-    # Additional
-    # dpi
-    if dpi != None:
-        add_dpi = {'figure.dpi': dpi}
-        config.update(add_dpi)
-    # legend frame
-    if frame_on:
-        add_legend_frame = {
-            'legend.frameon': True,
-            'legend.framealpha': 1.0,
-        }
-        config.update(add_legend_frame)
-    return config
+    if read_only:
+        return MappingProxyType(config)
+    return _with_fresh_cycler(config)
+
+## Presets
+_YSY_PRESETS[(300, True, True, False, False)] = ysy_settings()
+_YSY_PRESETS[(300, True, True, True, False)] = ysy_settings(jupyter=True)
+_SCIENCE_PRESETS[(None, False)] = science_settings()
+# 公开的预设是浅副本：增删键不影响上面的缓存，共享的 font.serif 是不可变元组
+YSY_DEFAULT = ysy_settings()
+YSY_JUPYTER = ysy_settings(jupyter=True)
+SCIENCE_DEFAULT = science_settings()
+
+## Apply
+def apply_settings(config, context=False):
+    '''
+    Applies a settings dictionary (e.g. from `ysy_settings` or `science_settings`) to Matplotlib in a single pass.
+
+    Every key is validated once by `rcParams`. With `context=True` nothing is changed globally; instead a
+    `matplotlib.rc_context` is returned, which applies the settings on entry and restores the previous
+    rcParams from a snapshot on exit.
+
+    Args:
+        config (dict): A dictionary of Matplotlib configuration settings.
+        context (bool, optional): Returns a context manager instead of updating the global rcParams. Defaults to False.
+
+    Returns:
+        None or contextlib.AbstractContextManager: The `rc_context` if `context` is True, otherwise None.
+
+    Examples:
+        >>> import matplotlib.pyplot as plt
+        >>> from ysy_plot_utils import ysy_settings, apply_settings
+        >>> apply_settings(ysy_settings())
+        >>> with apply_settings(ysy_settings(jupyter=True), context=True):
+        ...     plt.plot([0, 1, 2], [0, 1, 4])
+        ...     plt.show()
+
+    '''
+    if context:
+        return mpl.rc_context(config)
+    mpl.rcParams.update(config)
+    return None
 
 
 # Color
@@ -348,27 +475,71 @@ def firefly(requirement=None):
 
     Notes:
         - The function is flexible and can be used to style Matplotlib plots with custom color palettes.
+        - The named colors are also available as module constants (`FGRAYBLUE`, `FGRAYGREEN`, `FRED`, `FBLUEGREEN`, `FBLACK`, `FSILVER`).
+        - `PALETTE` is the preferred API: `PALETTE.fred`, `PALETTE.cycle` and `PALETTE.full` skip this function entirely.
+          Its palettes are tuples; `firefly` is kept for backward compatibility and returns lists.
         - Ensure the `requirement` string matches one of the predefined keys for specific color retrieval.
 
     '''
-    if requirement == None:
-        colors = ['#475d7b', '#97c6c0', '#e26e1b', '#4df8e8', '#3e324a', '#e6e4e0']
-        return colors
-    elif requirement == 'cycle':
-        colors = ['#475d7b', '#97c6c0', '#e26e1b', '#4df8e8']
-        return colors
-    else:
-        color_dictionary = {
-            'fgrayblue': '#475d7b', 
-            'fgraygreen': '#97c6c0', 
-            'fred': '#e26e1b', 
-            'fbluegreen': '#4df8e8', 
-            'fblack': '#3e324a', 
-            'fsilver': '#e6e4e0', 
-        }
-        return color_dictionary[requirement]
+    colors = _FIREFLY_MAP[requirement]
+    # 列表按值返回，调用方修改不会影响内置调色板
+    if isinstance(colors, tuple):
+        return list(colors)
+    return colors
     
 ## color-firefly2
+# 定义深色和浅色主题的颜色
+_FIREFLY_THEME_HEX = {
+    'dark': ("#FF8B4D", "#5AFFCC"),  # 深色主题
+    'light': ("#FF7C3A", "#1AFFB2"),  # 浅色主题
+}
+# 端点颜色的 RGB 数组（只读），导入时换算一次，采样时直接参与向量运算
+def _rgb_array(colors):
+    rgb = np.array([to_rgb(c) for c in colors])
+    rgb.setflags(write=False)
+    return rgb
+
+_FIREFLY_THEME_RGB = {key: _rgb_array(colors) for key, colors in _FIREFLY_THEME_HEX.items()}
+
+def _firefly_theme_key(dark_or_light):
+    # 根据选择的主题设置主题颜色，除 'light' 外都使用深色主题
+    return 'light' if dark_or_light == 'light' else 'dark'
+
+def _firefly_theme_colors(dark_or_light, reverse):
+    theme_colors = list(_FIREFLY_THEME_HEX[_firefly_theme_key(dark_or_light)])
+    # 颜色反向
+    if reverse:
+        theme_colors = theme_colors[::-1]
+    return theme_colors
+
+def _lerp_rgb(c0, c1, n):
+    # 两色线性渐变的直接插值，按 LinearSegmentedColormap 的 256 级查找表量化，结果与 cmap 采样一致
+    lut_n = 256
+    ts = np.linspace(0.0, 1.0, n)
+    ts = np.minimum((ts * lut_n).astype(int), lut_n - 1) / (lut_n - 1)
+    out = np.ones((n, 4))
+    out[:, :3] = c0 + (c1 - c0) * ts[:, None]
+    return out
+
+@functools.lru_cache(maxsize=8)
+def _build_firefly_cmap(dark_or_light, reverse):
+    # 创建自定义的线性渐变 colormap，基于主题颜色
+    theme_colors = _firefly_theme_colors(dark_or_light, reverse)
+    return LinearSegmentedColormap.from_list("firefly_theme", theme_colors)
+
+@functools.lru_cache(maxsize=8)
+def _build_firefly_cycle(dark_or_light, color_sample_num, reverse):
+    # 从渐变中采样一定数量的颜色作为颜色循环，不经过 colormap 对象
+    c0, c1 = _FIREFLY_THEME_RGB[_firefly_theme_key(dark_or_light)]
+    # 颜色反向
+    if reverse:
+        c0, c1 = c1, c0
+    return tuple(map(tuple, _lerp_rgb(c0, c1, color_sample_num)))
+
+@functools.lru_cache(maxsize=8)
+def _build_firefly_cycler(dark_or_light, color_sample_num, reverse):
+    return cycler('color', list(_build_firefly_cycle(dark_or_light, color_sample_num, reverse)))
+
 def firefly_color_theme(cmap_or_cycle=None, dark_or_light='dark', color_sample_num=10, set_color_cycle=False, reverse=False):
     """
     Generates and applies a custom color theme inspired by the 'Firefly Gallery' project.
@@ -407,37 +578,41 @@ def firefly_color_theme(cmap_or_cycle=None, dark_or_light='dark', color_sample_n
     Update:
         - Add "reverse".
     """
-    # 定义深色和浅色主题的颜色
-    dark_colors = ["#FF8B4D", "#5AFFCC"]  # 深色主题
-    light_colors = ["#FF7C3A", "#1AFFB2"]  # 浅色主题
-    # 根据选择的主题设置主题颜色
-    theme_colors = dark_colors
-    if dark_or_light == 'light':  # 如果用户选择了浅色主题
-        theme_colors = light_colors
-    # 颜色反向
-    if reverse:
-        theme_colors = theme_colors[::-1]
-    # 创建自定义的线性渐变 colormap，基于主题颜色
-    firefly_cmap = LinearSegmentedColormap.from_list("firefly_theme", theme_colors)
-    # 从渐变 colormap 中采样一定数量的颜色作为颜色循环
-    firefly_cycle = [firefly_cmap(i / (color_sample_num - 1)) for i in range(color_sample_num)]
-    # 设置颜色循环配置
-    add_color = {'axes.prop_cycle': cycler('color', firefly_cycle)}
-    # 如果需要设置颜色循环，更新 Matplotlib 的 rcParams
+    # 如果需要设置颜色循环，更新 Matplotlib 的 rcParams（cycler 已缓存，安装的是它的副本）
     if set_color_cycle:
-        plt.rcParams.update(add_color)
-    # 根据 cmap_or_cycle 参数返回不同的结果
+        mpl.rcParams.update({'axes.prop_cycle': copy.deepcopy(_build_firefly_cycler(dark_or_light, color_sample_num, reverse))})
+    # 根据 cmap_or_cycle 参数返回不同的结果（按值返回，避免调用方修改缓存）
     if cmap_or_cycle == 'cycle':
-        return firefly_cycle  # 返回颜色循环
+        return list(_build_firefly_cycle(dark_or_light, color_sample_num, reverse))  # 返回颜色循环
     elif cmap_or_cycle == 'cmap':
-        return firefly_cmap  # 返回 colormap
+        return _build_firefly_cmap(dark_or_light, reverse).copy()  # 返回 colormap
     return None  # 如果没有特定要求，返回 None
 
 
 # Plot
 
+# Multi-series, scatter and data-point drawing for `plot`
+def _plot_series(ax, x, y, legend_name, plot_type, data_point):
+    if isinstance(y, (tuple, list)):
+        # 绘图函数在循环外确定一次
+        draw = None
+        if plot_type == 'curve':
+            draw = ax.plot
+        elif plot_type == 'scatter':
+            draw = ax.scatter
+        if draw is not None:
+            for y_i, name in zip(y, legend_name, strict=True):
+                draw(x, y_i, label=name)
+    else:
+        if plot_type == 'curve':
+            ax.plot(x, y, label=legend_name, zorder=1)
+            if data_point is not None:
+                ax.scatter(data_point[0], data_point[1], label='Data Point', color=FBLACK, s=150, marker='x', zorder=2)
+        elif plot_type == 'scatter':
+            ax.scatter(x, y, label=legend_name)
+
 # Standardized Plot
-def plot(x, y, legend_name, plot_title='', x_label='X', y_label='Y', plot_type='curve', legend_title='', data_point=None):
+def plot(x, y, legend_name, plot_title='', x_label='X', y_label='Y', plot_type='curve', legend_title='', data_point=None, ax=None, show=True):
     '''
     A utility function to plot data using Matplotlib.
 
@@ -457,6 +632,8 @@ def plot(x, y, legend_name, plot_title='', x_label='X', y_label='Y', plot_type='
             - `'with point'` (Only available for single drawing mode): 
         legend_title (str, optional): The title of the legend box. Defaults to an empty string.
         data_point (tuple of lists/arrays): Plot a curve with the data points. You must pass in something of the form (x_data_point, y_data_point). Also, only single plotting mode is available.
+        ax (matplotlib.axes.Axes, optional): Existing axes to draw into. If `None` (default), a new figure is created.
+        show (bool, optional): Whether to call `plt.show()` after drawing. Only applies when `ax` is `None`. Defaults to True.
 
     Returns:
         None: The function does not return a value but displays the generated plot.
@@ -476,43 +653,91 @@ def plot(x, y, legend_name, plot_title='', x_label='X', y_label='Y', plot_type='
     Notes:
         - The function automatically handles multiple datasets if `y` is a tuple.
         - Ensure that the length of `legend_name` matches the number of datasets in `y` when `y` is a tuple.
-        - The plot is immediately displayed using `plt.show()`.
+        - The plot is immediately displayed using `plt.show()`, unless `ax` is given or `show=False`.
+        - Pass `ax` to draw into an existing subplot and reuse its figure across repeated calls.
 
     '''
-    plt.figure()
-    if isinstance(y, tuple) or isinstance(y, list):
-        for i in range(len(y)):
-            if plot_type == 'curve':
-                plt.plot(x, y[i], label=legend_name[i])
-            elif plot_type == 'scatter':
-                plt.scatter(x, y[i], label=legend_name[i])
+    import matplotlib.pyplot as plt
+
+    new_figure = ax is None
+    if new_figure:
+        _, ax = plt.subplots()
+    if plot_type == 'curve' and data_point is None and not isinstance(y, (tuple, list)):
+        # 最常见的单条曲线，直接绘制
+        ax.plot(x, y, label=legend_name, zorder=1)
     else:
-        if plot_type == 'curve':
-            plt.plot(x, y, label=legend_name, zorder=1)
-            if data_point != None:
-                plt.scatter(data_point[0], data_point[1], label='Data Point', color=firefly('fblack'), s=150, marker='x', zorder=2)
-        elif plot_type == 'scatter':
-            plt.scatter(x, y, label=legend_name)
-    plt.xlabel(x_label)
-    plt.ylabel(y_label)
-    plt.title(plot_title)
-    plt.legend(title=legend_title)
-    plt.show()
+        _plot_series(ax, x, y, legend_name, plot_type, data_point)
+    ax.set(xlabel=x_label, ylabel=y_label, title=plot_title)
+    ax.legend(title=legend_title)
+    if new_figure and show:
+        plt.show()
     return None
 
 
 # === 以下v1.3是新增功能 ===
 # Style Manager
 
+## 样式文本解析（与 matplotlib 读取 .mplstyle 文件的规则一致）
+def _strip_style_comment(line):
+    # 去掉第一个不在双引号内的 # 之后的内容
+    pos = 0
+    while True:
+        quote_pos = line.find('"', pos)
+        hash_pos = line.find('#', pos)
+        if quote_pos < 0:
+            return (line if hash_pos < 0 else line[:hash_pos]).strip()
+        if 0 <= hash_pos < quote_pos:
+            return line[:hash_pos].strip()
+        closing_quote_pos = line.find('"', quote_pos + 1)
+        if closing_quote_pos < 0:
+            raise ValueError(f"Missing closing quote in style line: {line!r}")
+        pos = closing_quote_pos + 1
+
+# 与样式无关的参数，matplotlib.style.use 会忽略它们（同 matplotlib.style.core.STYLE_BLACKLIST）
+_STYLE_BLACKLIST = frozenset({
+    'interactive', 'backend', 'webagg.port', 'webagg.address', 'webagg.port_retries',
+    'webagg.open_in_browser', 'backend_fallback', 'toolbar', 'timezone', 'figure.max_open_warning',
+    'figure.raise_window', 'savefig.directory', 'tk.window_focus', 'docstring.hardcopy', 'date.epoch',
+})
+
+@functools.lru_cache(maxsize=128)
+def _parse_mplstyle_text(text):
+    # 按样式文本缓存：修改或新增 PRESET_STYLES 条目后自然得到新的解析结果；返回的字典会被缓存共享，调用方只读不改
+    params = {}
+    for line in text.splitlines():
+        line = _strip_style_comment(line)
+        if not line:
+            continue
+        key, sep, val = line.partition(':')
+        key, val = key.strip(), val.strip()
+        if not sep or key not in mpl.rcParams:
+            warnings.warn(f"Ignoring invalid style line: {line!r}")
+            continue
+        if key in _STYLE_BLACKLIST:
+            warnings.warn(f"Style includes a parameter, {key!r}, that is not related to style. Ignoring this parameter.")
+            continue
+        if val.startswith('"') and val.endswith('"'):
+            val = val[1:-1]
+        # 解析时就校验取值，坏值跳过该行而不是在 rc_context 中整体报错
+        try:
+            mpl.RcParams({key: val})
+        except (ValueError, KeyError) as err:
+            warnings.warn(f"Bad value in style line {line!r}: {err}")
+            continue
+        params[key] = val
+    return params
+
 ## 临时样式组装加载器
 @contextlib.contextmanager
 def temp_style(style_keys=None, extra_style: str = ""):
     """
     Temporarily applies a custom matplotlib style composed from preset and/or extra style definitions.
 
-    This context manager dynamically creates a temporary `.mplstyle` file by combining predefined style
-    snippets (from `PRESET_STYLES`) and any additional user-defined style string, then applies it using
-    `matplotlib.style.use`. Upon exiting the context, it restores the default style and removes the temporary file.
+    This context manager combines predefined style snippets (looked up in `PRESET_STYLES` on each call; each style text is parsed once and cached) and any
+    additional user-defined style string into a single rcParams dictionary, then applies it using
+    `matplotlib.rc_context`. Upon exiting the context, it restores the rcParams that were active before entering
+    (a snapshot taken on entry, so settings applied earlier, e.g. via `ysy_settings`, survive). No style files
+    are written.
 
     Parameters
     ----------
@@ -523,6 +748,8 @@ def temp_style(style_keys=None, extra_style: str = ""):
     extra_style : str, optional
         Additional matplotlib style definitions provided as a raw string, which will be appended to the
         combined style content.
+        As with `matplotlib.style.use`, lines with unknown keys or bad values and parameters unrelated to
+        style (e.g. `backend`) are skipped with a warning.
 
     Raises
     ------
@@ -541,26 +768,17 @@ def temp_style(style_keys=None, extra_style: str = ""):
     ...     plt.show()
     
     """
-    combined_style = ""
-    if style_keys:
-        for key in style_keys:
-            if key in PRESET_STYLES:
-                combined_style += PRESET_STYLES[key] + "\n"
-            else:
-                raise ValueError(f"Unknown style key: {key}")
-    combined_style += extra_style
-
-    with tempfile.NamedTemporaryFile('w+', suffix='.mplstyle', delete=False) as tmp:
-        tmp.write(combined_style)
-        tmp_path = tmp.name
-
-    try:
-        mplstyle.use(tmp_path)
+    merged = {}
+    for key in style_keys or ():
+        text = PRESET_STYLES.get(key)
+        if text is None:
+            raise ValueError(f"Unknown style key: {key}")
+        merged.update(_parse_mplstyle_text(text))
+    merged.update(_parse_mplstyle_text(extra_style))
+
+    # rc_context 进入时快照 rcParams，退出时直接还原
+    with mpl.rc_context(merged):
         yield
-    finally:
-        mplstyle.reload_library()
-        mplstyle.use('default')
-        os.remove(tmp_path)
 
 ## 内置样式
 def print_preset_styles():
@@ -1037,3 +1255,8 @@ axes.prop_cycle: cycler('color', ['388ef7', 'f7786b', '91dce8', 'd16d7c', '766c9
 """,
     # 其他样式继续添加
 }
+
+## 导入时预先解析内置样式，填充 `_parse_mplstyle_text` 的缓存
+for _style_text in PRESET_STYLES.values():
+    _parse_mplstyle_text(_style_text)
+del _style_text
@@ -7,8 +7,8 @@ import numpy as np
 from scipy.optimize import curve_fit
 import matplotlib.pyplot as plt
 
-# 设置全局字号大小和图像尺寸
-plt.rcParams.update({
+# 字号大小和图像尺寸（只在绘图时通过 rc_context 生效，不改动全局设置）
+PLOT_STYLE = {
     'font.size': 12,
     'axes.titlesize': 20,
     'axes.labelsize': 24,
@@ -16,7 +16,7 @@ plt.rcParams.update({
     'ytick.labelsize': 20,
     'legend.fontsize': 20,
     'figure.figsize': (8.27, 11.69)
-})
+}
 
 # 读取Excel文件中的数据
 df = pd.read_excel('ET1_6data_else.xlsx', sheet_name='RL相频')
@@ -27,14 +27,33 @@ x_data = np.array(df['f'])
 y_data = np.array(df['Δφ（示波器自动测定）'])
 
 
-# 定义要拟合的函数模型
+# 定义要拟合的函数模型：(R+jωL)/(1-ω²CL+jωCR) 的相位
+# 相位等于 分子×分母共轭 的辐角（分母模长为正，不改变相位），直接用实数 arctan2 计算，不构造复数数组
 def func(w,R,L,C):
-    return  np.angle((R+1j*w*L)/(-w**2*C*L+1j*w*C*R+1))
+    num_i = w*L
+    den_r = 1 - w**2*C*L
+    den_i = w*C*R
+    return np.arctan2(num_i*den_r - R*den_i, R*den_r + num_i*den_i)
+
+
+# 模型对 (R, L, C) 的解析雅可比矩阵，供 curve_fit 使用，省去数值差分
+# 相位 = arg(分子) - arg(分母)，而 d arg(z) = (Re(z)·dIm(z) - Im(z)·dRe(z)) / |z|²
+def jac(w,R,L,C):
+    num_i = w*L
+    num2 = R**2 + num_i**2
+    den_r = 1 - w**2*C*L
+    den_i = w*C*R
+    den2 = den_r**2 + den_i**2
+    return np.column_stack([
+        -num_i/num2 - w*C*den_r/den2,
+        w*R/num2 - w**2*C*den_i/den2,
+        -(w*R*den_r + w**2*L*den_i)/den2,
+    ])
 
 
 initial_guess = [1, 0.001, 0.1]
 # 使用curve_fit进行拟合
-popt, pcov = curve_fit(func, x_data, y_data, p0=initial_guess)
+popt, pcov = curve_fit(func, x_data, y_data, p0=initial_guess, jac=jac)
 
 # 计算相关系数
 residuals = y_data - func(x_data, *popt)
@@ -48,17 +67,18 @@ print("相关系数:", r_squared)
 x_plot = np.linspace(10, 100000, num=1000)
 
 # 绘制拟合结果
-plt.figure()
-plt.scatter(x_data, y_data, label='$DataPoint$')
+with plt.rc_context(PLOT_STYLE):
+    plt.figure()
+    plt.scatter(x_data, y_data, label='$DataPoint$')
 
-# plt.plot(x_plot, func(x_plot, *popt), 'r-', label='$Fitting$:  bias_1=%5.3f mV, bias_2=%5.3f mV,bias_3=%5.3f mV, $R^2$=%.6f ' % (*popt, r_squared))
-plt.plot(x_plot, func(x_plot, *popt), 'r-')
+    # plt.plot(x_plot, func(x_plot, *popt), 'r-', label='$Fitting$:  bias_1=%5.3f mV, bias_2=%5.3f mV,bias_3=%5.3f mV, $R^2$=%.6f ' % (*popt, r_squared))
+    plt.plot(x_plot, func(x_plot, *popt), 'r-')
 
-# plt.xlabel('T/K', fontsize=20)
-plt.xlabel('f')
-# plt.ylabel('U/mV', fontsize=20)
-plt.ylabel('$\\phi$')
+    # plt.xlabel('T/K', fontsize=20)
+    plt.xlabel('f')
+    # plt.ylabel('U/mV', fontsize=20)
+    plt.ylabel('$\\phi$')
 
-# plt.legend(fontsize='large')
-plt.legend()
-plt.show()
+    # plt.legend(fontsize='large')
+    plt.legend()
+    plt.show()